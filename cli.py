@@ -1,21 +1,108 @@
 import argparse
 import sys
-from colorama import init, Fore, Style
-from trading_bot import BasicBot
-from config import API_KEY, API_SECRET, TESTNET, DEFAULT_SYMBOL
-from logger import logger
+from display_fields import ACCOUNT_FIELDS, ORDER_FIELDS
 
-# Initialize colorama
-init()
+# Heavy imports (colorama, trading_bot, config, logger) are deferred to the
+# code paths that need them so `--help` and argument errors stay fast.
+_COLOR_CACHE = None
+
+class _LazyDefault:
+    """argparse default that reads a config value only when it is needed.
+    
+    argparse leaves non-string defaults untouched and only renders them for
+    help text, so config is imported on demand rather than at startup.
+    """
+    def __init__(self, name):
+        self.name = name
+    
+    def resolve(self):
+        import config
+        return getattr(config, self.name)
+    
+    def __str__(self):
+        return str(self.resolve())
+
+
+# Shared argument specs: (flag, add_argument keyword arguments)
+_SYMBOL_ARG = ('--symbol', dict(type=str, default=_LazyDefault('DEFAULT_SYMBOL'), help='Trading symbol (default: %(default)s)'))
+_SIDE_ARG = ('--side', dict(type=str, choices=['BUY', 'SELL'], required=True, help='Order side (BUY or SELL)'))
+_QUANTITY_ARG = ('--quantity', dict(type=float, required=True, help='Order quantity'))
+_PRICE_ARG = ('--price', dict(type=float, required=True, help='Limit price'))
+
+# Command table: (name, help, argument specs)
+_CMDS = (
+    ('account', 'Get account information', ()),
+    ('balance', 'Get account balance', (
+        ('--asset', dict(type=str, default='USDT', help='Asset to check balance for (default: USDT)')),
+    )),
+    ('price', 'Get current market price', (_SYMBOL_ARG,)),
+    ('market', 'Place a market order', (_SYMBOL_ARG, _SIDE_ARG, _QUANTITY_ARG)),
+    ('limit', 'Place a limit order', (_SYMBOL_ARG, _SIDE_ARG, _QUANTITY_ARG, _PRICE_ARG)),
+    ('stop', 'Place a stop limit order', (
+        _SYMBOL_ARG, _SIDE_ARG, _QUANTITY_ARG, _PRICE_ARG,
+        ('--stop_price', dict(type=float, required=True, help='Stop price')),
+    )),
+    ('open_orders', 'Get open orders', (
+        ('--symbol', dict(type=str, default=None, help='Trading symbol (default: all symbols)')),
+    )),
+    ('cancel', 'Cancel an order', (
+        ('--symbol', dict(type=str, required=True, help='Trading symbol')),
+        ('--order_id', dict(type=int, required=True, help='Order ID to cancel')),
+    )),
+)
+
+_COMMANDS = frozenset(name for name, _, _ in _CMDS)
+
+
+def _sniff_subcommand(argv):
+    """Return the first token in argv that names a command, or None."""
+    for token in argv:
+        if token in _COMMANDS:
+            return token
+    return None
+
+
+class _NoColor:
+    """Stand-in for colorama's Fore/Style that renders every code as ''."""
+    def __getattr__(self, name):
+        return ''
+
+
+def _colors():
+    """Return (Fore, Style), loading colorama only when stdout is a terminal."""
+    global _COLOR_CACHE
+    if _COLOR_CACHE is None:
+        if sys.stdout.isatty():
+            from colorama import init, Fore, Style
+            init()
+            _COLOR_CACHE = (Fore, Style)
+        else:
+            # Redirected output gets plain text and no console hook
+            _COLOR_CACHE = (_NoColor(), _NoColor())
+    return _COLOR_CACHE
 
 class TradingBotCLI:
     def __init__(self):
         """Initialize the CLI interface."""
         self.bot = None
         self.parser = self._create_parser()
+        self._handlers = {
+            'account': self._cmd_account,
+            'balance': self._cmd_balance,
+            'price': self._cmd_price,
+            'market': self._cmd_market,
+            'limit': self._cmd_limit,
+            'stop': self._cmd_stop,
+            'open_orders': self._cmd_open_orders,
+            'cancel': self._cmd_cancel,
+        }
     
-    def _create_parser(self):
-        """Create command line argument parser."""
+    def _create_parser(self, argv=None):
+        """Create command line argument parser.
+        
+        Every command is registered so the top-level help and choices stay
+        complete, but only the command named in argv gets its arguments.
+        """
         parser = argparse.ArgumentParser(
             description='PrimeTrades - A simplified trading bot for Binance Futures',
             formatter_class=argparse.RawTextHelpFormatter
@@ -24,52 +111,24 @@ class TradingBotCLI:
         # Main commands
         subparsers = parser.add_subparsers(dest='command', help='Command to execute')
         
-        # Account info command
-        account_parser = subparsers.add_parser('account', help='Get account information')
-        
-        # Balance command
-        balance_parser = subparsers.add_parser('balance', help='Get account balance')
-        balance_parser.add_argument('--asset', type=str, default='USDT', help='Asset to check balance for (default: USDT)')
-        
-        # Price command
-        price_parser = subparsers.add_parser('price', help='Get current market price')
-        price_parser.add_argument('--symbol', type=str, default=DEFAULT_SYMBOL, help=f'Trading symbol (default: {DEFAULT_SYMBOL})')
-        
-        # Market order command
-        market_parser = subparsers.add_parser('market', help='Place a market order')
-        market_parser.add_argument('--symbol', type=str, default=DEFAULT_SYMBOL, help=f'Trading symbol (default: {DEFAULT_SYMBOL})')
-        market_parser.add_argument('--side', type=str, choices=['BUY', 'SELL'], required=True, help='Order side (BUY or SELL)')
-        market_parser.add_argument('--quantity', type=float, required=True, help='Order quantity')
-        
-        # Limit order command
-        limit_parser = subparsers.add_parser('limit', help='Place a limit order')
-        limit_parser.add_argument('--symbol', type=str, default=DEFAULT_SYMBOL, help=f'Trading symbol (default: {DEFAULT_SYMBOL})')
-        limit_parser.add_argument('--side', type=str, choices=['BUY', 'SELL'], required=True, help='Order side (BUY or SELL)')
-        limit_parser.add_argument('--quantity', type=float, required=True, help='Order quantity')
-        limit_parser.add_argument('--price', type=float, required=True, help='Limit price')
-        
-        # Stop limit order command
-        stop_limit_parser = subparsers.add_parser('stop', help='Place a stop limit order')
-        stop_limit_parser.add_argument('--symbol', type=str, default=DEFAULT_SYMBOL, help=f'Trading symbol (default: {DEFAULT_SYMBOL})')
-        stop_limit_parser.add_argument('--side', type=str, choices=['BUY', 'SELL'], required=True, help='Order side (BUY or SELL)')
-        stop_limit_parser.add_argument('--quantity', type=float, required=True, help='Order quantity')
-        stop_limit_parser.add_argument('--price', type=float, required=True, help='Limit price')
-        stop_limit_parser.add_argument('--stop_price', type=float, required=True, help='Stop price')
-        
-        # Open orders command
-        open_orders_parser = subparsers.add_parser('open_orders', help='Get open orders')
-        open_orders_parser.add_argument('--symbol', type=str, default=None, help='Trading symbol (default: all symbols)')
-        
-        # Cancel order command
-        cancel_parser = subparsers.add_parser('cancel', help='Cancel an order')
-        cancel_parser.add_argument('--symbol', type=str, required=True, help='Trading symbol')
-        cancel_parser.add_argument('--order_id', type=int, required=True, help='Order ID to cancel')
+        selected = _sniff_subcommand(sys.argv[1:] if argv is None else argv)
+        for name, help_text, arguments in _CMDS:
+            if name != selected:
+                # Stub so the command still shows up in the help listing
+                subparsers.add_parser(name, help=help_text, add_help=False)
+                continue
+            command_parser = subparsers.add_parser(name, help=help_text)
+            for flag, options in arguments:
+                command_parser.add_argument(flag, **options)
         
         return parser
     
     def _initialize_bot(self):
         """Initialize the trading bot."""
         if self.bot is None:
+            from trading_bot import BasicBot
+            from config import API_KEY, API_SECRET, TESTNET
+            Fore, Style = _colors()
             try:
                 self.bot = BasicBot(API_KEY, API_SECRET, TESTNET)
                 print(f"{Fore.GREEN}✓ Connected to Binance {'TESTNET' if TESTNET else 'PRODUCTION'}{Style.RESET_ALL}")
@@ -79,29 +138,94 @@ class TradingBotCLI:
     
     def _print_account_info(self, account_info):
         """Print account information in a formatted way."""
-        print(f"\n{Fore.CYAN}=== Account Information ==={Style.RESET_ALL}")
-        print(f"Account Type: {account_info.get('accountType', 'N/A')}")
-        print(f"Total Initial Margin: {account_info.get('totalInitialMargin', 'N/A')} USDT")
-        print(f"Total Maintenance Margin: {account_info.get('totalMaintMargin', 'N/A')} USDT")
-        print(f"Total Wallet Balance: {account_info.get('totalWalletBalance', 'N/A')} USDT")
-        print(f"Total Unrealized Profit: {account_info.get('totalUnrealizedProfit', 'N/A')} USDT")
-        print(f"Total Margin Balance: {account_info.get('totalMarginBalance', 'N/A')} USDT")
-        print(f"Available Balance: {account_info.get('availableBalance', 'N/A')} USDT")
+        Fore, Style = _colors()
+        lines = [f"\n{Fore.CYAN}=== Account Information ==={Style.RESET_ALL}"]
+        lines.extend(template.format(account_info.get(key, 'N/A')) for template, key in ACCOUNT_FIELDS)
+        print('\n'.join(lines))
+    
+    def _format_order_details(self, order):
+        """Format order details for display."""
+        Fore, Style = _colors()
+        lines = [f"\n{Fore.CYAN}=== Order Details ==={Style.RESET_ALL}"]
+        lines.extend(template.format(order.get(key, 'N/A')) for template, key in ORDER_FIELDS)
+        if 'stopPrice' in order:
+            lines.append(f"Stop Price: {order.get('stopPrice', 'N/A')}")
+        return '\n'.join(lines)
     
     def _print_order_details(self, order):
         """Print order details in a formatted way."""
-        print(f"\n{Fore.CYAN}=== Order Details ==={Style.RESET_ALL}")
-        print(f"Order ID: {order.get('orderId', 'N/A')}")
-        print(f"Symbol: {order.get('symbol', 'N/A')}")
-        print(f"Side: {order.get('side', 'N/A')}")
-        print(f"Type: {order.get('type', 'N/A')}")
-        print(f"Price: {order.get('price', 'N/A')}")
-        print(f"Original Quantity: {order.get('origQty', 'N/A')}")
-        print(f"Executed Quantity: {order.get('executedQty', 'N/A')}")
-        print(f"Status: {order.get('status', 'N/A')}")
-        print(f"Time In Force: {order.get('timeInForce', 'N/A')}")
-        if 'stopPrice' in order:
-            print(f"Stop Price: {order.get('stopPrice', 'N/A')}")
+        print(self._format_order_details(order))
+    
+    def _cmd_account(self, args):
+        """Handle the account command."""
+        account_info = self.bot.get_account_info()
+        self._print_account_info(account_info)
+    
+    def _cmd_balance(self, args):
+        """Handle the balance command."""
+        Fore, Style = _colors()
+        balance = self.bot.get_balance(args.asset)
+        print(f"\n{Fore.CYAN}=== Balance Information ==={Style.RESET_ALL}\n"
+              f"Asset: {args.asset}\n"
+              f"Available Balance: {balance} {args.asset}")
+    
+    def _cmd_price(self, args):
+        """Handle the price command."""
+        Fore, Style = _colors()
+        price = self.bot.get_market_price(args.symbol)
+        print(f"\n{Fore.CYAN}=== Price Information ==={Style.RESET_ALL}\n"
+              f"Symbol: {args.symbol}\n"
+              f"Current Price: {price}")
+    
+    def _cmd_market(self, args):
+        """Handle the market command."""
+        order = self.bot.place_market_order(
+            symbol=args.symbol,
+            side=args.side,
+            quantity=args.quantity
+        )
+        self._print_order_details(order)
+    
+    def _cmd_limit(self, args):
+        """Handle the limit command."""
+        order = self.bot.place_limit_order(
+            symbol=args.symbol,
+            side=args.side,
+            quantity=args.quantity,
+            price=args.price
+        )
+        self._print_order_details(order)
+    
+    def _cmd_stop(self, args):
+        """Handle the stop command."""
+        order = self.bot.place_stop_limit_order(
+            symbol=args.symbol,
+            side=args.side,
+            quantity=args.quantity,
+            price=args.price,
+            stop_price=args.stop_price
+        )
+        self._print_order_details(order)
+    
+    def _cmd_open_orders(self, args):
+        """Handle the open_orders command."""
+        Fore, Style = _colors()
+        orders = self.bot.get_open_orders(args.symbol)
+        # Collect every order and write the listing in one go
+        lines = [f"\n{Fore.CYAN}=== Open Orders ==={Style.RESET_ALL}"]
+        if not orders:
+            lines.append("No open orders found.")
+        else:
+            for order in orders:
+                lines.append(self._format_order_details(order))
+                lines.append('')
+        print('\n'.join(lines))
+    
+    def _cmd_cancel(self, args):
+        """Handle the cancel command."""
+        Fore, Style = _colors()
+        self.bot.cancel_order(args.symbol, args.order_id)
+        print(f"\n{Fore.GREEN}✓ Order {args.order_id} cancelled successfully{Style.RESET_ALL}")
     
     def run(self):
         """Run the CLI interface."""
@@ -111,69 +235,19 @@ class TradingBotCLI:
             self.parser.print_help()
             return
         
+        symbol = getattr(args, 'symbol', None)
+        if isinstance(symbol, _LazyDefault):
+            args.symbol = symbol.resolve()
+        
         self._initialize_bot()
         
         try:
-            if args.command == 'account':
-                account_info = self.bot.get_account_info()
-                self._print_account_info(account_info)
-                
-            elif args.command == 'balance':
-                balance = self.bot.get_balance(args.asset)
-                print(f"\n{Fore.CYAN}=== Balance Information ==={Style.RESET_ALL}")
-                print(f"Asset: {args.asset}")
-                print(f"Available Balance: {balance} {args.asset}")
-                
-            elif args.command == 'price':
-                price = self.bot.get_market_price(args.symbol)
-                print(f"\n{Fore.CYAN}=== Price Information ==={Style.RESET_ALL}")
-                print(f"Symbol: {args.symbol}")
-                print(f"Current Price: {price}")
-                
-            elif args.command == 'market':
-                order = self.bot.place_market_order(
-                    symbol=args.symbol,
-                    side=args.side,
-                    quantity=args.quantity
-                )
-                self._print_order_details(order)
-                
-            elif args.command == 'limit':
-                order = self.bot.place_limit_order(
-                    symbol=args.symbol,
-                    side=args.side,
-                    quantity=args.quantity,
-                    price=args.price
-                )
-                self._print_order_details(order)
-                
-            elif args.command == 'stop':
-                order = self.bot.place_stop_limit_order(
-                    symbol=args.symbol,
-                    side=args.side,
-                    quantity=args.quantity,
-                    price=args.price,
-                    stop_price=args.stop_price
-                )
-                self._print_order_details(order)
-                
-            elif args.command == 'open_orders':
-                orders = self.bot.get_open_orders(args.symbol)
-                print(f"\n{Fore.CYAN}=== Open Orders ==={Style.RESET_ALL}")
-                if not orders:
-                    print("No open orders found.")
-                else:
-                    for order in orders:
-                        self._print_order_details(order)
-                        print()
-                        
-            elif args.command == 'cancel':
-                result = self.bot.cancel_order(args.symbol, args.order_id)
-                print(f"\n{Fore.GREEN}✓ Order {args.order_id} cancelled successfully{Style.RESET_ALL}")
-                
+            self._handlers[args.command](args)
         except Exception as e:
+            Fore, Style = _colors()
             print(f"\n{Fore.RED}✗ Error: {e}{Style.RESET_ALL}")
-            logger.error(f"CLI Error: {e}")
+            from logger import logger
+            logger.error("CLI Error: %s", e)
 
 if __name__ == "__main__":
     cli = TradingBotCLI()
@@ -17,6 +17,12 @@ PRODUCTION_BASE_URL = 'https://fapi.binance.com'
 LOG_LEVEL = 'INFO'
 LOG_FILE = 'trading_bot.log'
 
+# Position persistence: seconds to coalesce position updates before writing
+POSITIONS_FLUSH_INTERVAL = 1.0
+
+# Seconds a fetched futures account snapshot is reused for balance lookups
+ACCOUNT_CACHE_TTL = 1.0
+
 # Default trading parameters
 DEFAULT_SYMBOL = 'BTCUSDT'
 DEFAULT_QUANTITY = 0.001  # Minimum quantity for BTC
\ No newline at end of file
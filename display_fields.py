@@ -0,0 +1,27 @@
+"""
+Display templates shared by the CLI and the Tk UI.
+Pure data with no imports, so it is cheap to load from either front end.
+"""
+
+# Display templates: (line template, response key)
+ACCOUNT_FIELDS = (
+    ('Account Type: {}', 'accountType'),
+    ('Total Initial Margin: {} USDT', 'totalInitialMargin'),
+    ('Total Maintenance Margin: {} USDT', 'totalMaintMargin'),
+    ('Total Wallet Balance: {} USDT', 'totalWalletBalance'),
+    ('Total Unrealized Profit: {} USDT', 'totalUnrealizedProfit'),
+    ('Total Margin Balance: {} USDT', 'totalMarginBalance'),
+    ('Available Balance: {} USDT', 'availableBalance'),
+)
+
+ORDER_FIELDS = (
+    ('Order ID: {}', 'orderId'),
+    ('Symbol: {}', 'symbol'),
+    ('Side: {}', 'side'),
+    ('Type: {}', 'type'),
+    ('Price: {}', 'price'),
+    ('Original Quantity: {}', 'origQty'),
+    ('Executed Quantity: {}', 'executedQty'),
+    ('Status: {}', 'status'),
+    ('Time In Force: {}', 'timeInForce'),
+)
@@ -4,23 +4,47 @@ Enhanced Trading Bot with Position Management
 This module combines Binance API trading functionality with position management.
 """
 
-from binance.client import Client
-from binance.enums import *
-from binance.exceptions import BinanceAPIException, BinanceRequestException
-import requests
 import hmac
-import hashlib
 import time
-import urllib.parse
 import sys
 import json
 import os
-from datetime import datetime
+import atexit
+import threading
 from logger import logger
-from config import API_KEY, API_SECRET, TESTNET, TESTNET_BASE_URL, DEFAULT_SYMBOL
+from config import API_KEY, API_SECRET, TESTNET, TESTNET_BASE_URL, PRODUCTION_BASE_URL, DEFAULT_SYMBOL, POSITIONS_FLUSH_INTERVAL, ACCOUNT_CACHE_TTL
+
+# python-binance and requests are imported where they are first needed, so
+# commands that only touch local positions start without them
+_BINANCE_ERRORS = None
+
+
+def _binance_errors():
+    """Return the python-binance API exception types, importing them on first use."""
+    global _BINANCE_ERRORS
+    if _BINANCE_ERRORS is None:
+        from binance.exceptions import BinanceAPIException, BinanceRequestException
+        _BINANCE_ERRORS = (BinanceAPIException, BinanceRequestException)
+    return _BINANCE_ERRORS
+
+
+# Prefer orjson for (de)serialization when it is installed
+try:
+    import orjson
+
+    def _dumps_positions(positions):
+        return orjson.dumps(positions, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps_positions(positions):
+        return json.dumps(positions, indent=2).encode('utf-8')
+
+    _loads = json.loads
 
 class EnhancedTradingBot:
-    def __init__(self, api_key=API_KEY, api_secret=API_SECRET, testnet=TESTNET, positions_file="positions.json"):
+    def __init__(self, api_key=API_KEY, api_secret=API_SECRET, testnet=TESTNET, positions_file="positions.json",
+                 lazy_client=True):
         """
         Initialize the enhanced trading bot with both API connectivity and position management.
         
@@ -29,35 +53,86 @@ class EnhancedTradingBot:
             api_secret (str): Binance API secret
             testnet (bool): Whether to use testnet
             positions_file (str): File to store position data
+            lazy_client (bool): Defer creating and pinging the Binance client
+                until the first API call; pass False to connect immediately
         """
         self.api_key = api_key
         self.api_secret = api_secret
+        self._api_secret_bytes = api_secret.encode('utf-8')
         self.testnet = testnet
         self.positions_file = positions_file
+        self._abs_positions_path = os.path.abspath(positions_file)
+        
+        # Make sure the positions directory exists once, up front, so saves
+        # don't have to check it every time
+        try:
+            os.makedirs(os.path.dirname(self._abs_positions_path), exist_ok=True)
+        except OSError as e:
+            logger.error("Error creating positions directory: %s", e)
         
         # Initialize positions tracking
         self.positions = self._load_positions()
+        
+        # Position writes are coalesced: trades only mark the cache dirty and
+        # a deferred flush (or interpreter exit) writes it to disk.
+        self._dirty = False
+        self._flush_timer = None
+        self._positions_lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        atexit.register(self._flush_positions)
+        
+        # Persistent HTTP session for direct Futures requests, built on first use
+        self._base_url = TESTNET_BASE_URL if testnet else PRODUCTION_BASE_URL
+        self._session = None
+        
+        # Short-lived cache of futures account assets keyed by asset name
+        self._asset_index = None
+        self._asset_index_time = 0.0
+
+        # The Binance client is created (and pinged) on first use, so
+        # position-only operations never touch the network
+        self._client = None
+        self._client_lock = threading.Lock()
+        if not lazy_client:
+            self.connect()
+
+    @property
+    def client(self):
+        """Binance client, created and connectivity-checked on first access."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._connect()
+        return self._client
 
-        # Initialize Binance client
-        self.client = Client(api_key, api_secret, testnet=testnet)
+    def _connect(self):
+        """Create the Binance client and verify Futures connectivity."""
+        from binance.client import Client
 
-        if testnet:
+        client = Client(self.api_key, self.api_secret, testnet=self.testnet)
+
+        if self.testnet:
             # Configure testnet URLs properly
-            self.client.API_URL = 'https://testnet.binance.vision/api'
-            self.client.FUTURES_URL = 'https://testnet.binancefuture.com/fapi'
-            self.client.FUTURES_DATA_URL = 'https://testnet.binancefuture.com/futures/data'
+            client.API_URL = 'https://testnet.binance.vision/api'
+            client.FUTURES_URL = 'https://testnet.binancefuture.com/fapi'
+            client.FUTURES_DATA_URL = 'https://testnet.binancefuture.com/futures/data'
             logger.info("Running in TESTNET mode (Futures)")
         else:
             logger.info("Running in PRODUCTION mode")
 
         # Verify Futures connectivity
         try:
-            self.client.futures_ping()
+            client.futures_ping()
             logger.info("Successfully connected to Binance Futures API")
             print("✅ Futures connection successful")
         except Exception as e:
-            logger.error(f"Failed to connect to Binance Futures API: {e}")
+            logger.error("Failed to connect to Binance Futures API: %s", e)
             raise
+        return client
+
+    def connect(self):
+        """Connect to Binance now instead of on the first API call."""
+        return self.client
 
     #
     # Position Management Methods
@@ -65,28 +140,48 @@ class EnhancedTradingBot:
     
     def _load_positions(self):
         """Load positions from file or initialize with empty positions."""
-        abs_path = os.path.abspath(self.positions_file)
-        if os.path.exists(abs_path):
-            try:
-                with open(abs_path, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                logger.error(f"Error loading positions: {e}")
-                return {}
-        return {}
+        try:
+            with open(self._abs_positions_path, 'rb') as f:
+                return _loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, IOError) as e:
+            logger.error("Error loading positions: %s", e)
+            return {}
     
-    def _save_positions(self):
-        """Save positions to file."""
+    def _save_positions(self, positions=None):
+        """Save positions to file atomically."""
+        if positions is None:
+            positions = self.positions
         try:
-            # Ensure directory exists (resolve absolute path)
-            abs_path = os.path.abspath(self.positions_file)
-            dir_path = os.path.dirname(abs_path)
-            if dir_path and not os.path.exists(dir_path):
-                os.makedirs(dir_path, exist_ok=True)
-            with open(abs_path, 'w') as f:
-                json.dump(self.positions, f, indent=2)
+            # Write to a temporary file and swap it in so a crash mid-write
+            # never leaves a truncated positions file behind
+            tmp_path = self._abs_positions_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps_positions(positions))
+            os.replace(tmp_path, self._abs_positions_path)
         except IOError as e:
-            logger.error(f"Error saving positions: {e}")
+            logger.error("Error saving positions: %s", e)
+    
+    def _schedule_flush(self):
+        """Schedule a deferred positions flush if one is not already pending."""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(POSITIONS_FLUSH_INTERVAL, self._flush_positions)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def _flush_positions(self):
+        """Write positions to disk if they changed since the last flush."""
+        # The save lock keeps concurrent flushes (timer vs. atexit) ordered
+        # while trades only contend on the cheap positions lock
+        with self._save_lock:
+            with self._positions_lock:
+                self._flush_timer = None
+                if not self._dirty:
+                    return
+                self._dirty = False
+                snapshot = dict(self.positions)
+            self._save_positions(snapshot)
     
     def get_position(self, symbol):
         """
@@ -115,27 +210,30 @@ class EnhancedTradingBot:
         # Ensure quantity is positive
         quantity = abs(float(quantity))
         
-        # Get current position
-        current_position = self.get_position(symbol)
-        
-        # Update position based on order type
-        if is_buy:
-            new_position = current_position + quantity
-        else:
-            new_position = current_position - quantity
+        # Read and write under one lock so concurrent orders on the same
+        # symbol cannot lose an update
+        with self._positions_lock:
+            # Get current position
+            current_position = self.get_position(symbol)
+            
+            # Update position based on order type
+            if is_buy:
+                new_position = current_position + quantity
+            else:
+                new_position = current_position - quantity
             
-        self.positions[symbol] = new_position
-        
-        # Save updated positions
-        self._save_positions()
+            self.positions[symbol] = new_position
+            # Mark for the next deferred save instead of writing per trade
+            self._dirty = True
+            self._schedule_flush()
         
         # Log position status
         if new_position == 0:
-            logger.info(f"Position in {symbol} is now closed (0).")
+            logger.info("Position in %s is now closed (0).", symbol)
         elif new_position < 0:
-            logger.info(f"Short position in {symbol} with net position: {new_position}.")
+            logger.info("Short position in %s with net position: %s.", symbol, new_position)
         else:
-            logger.info(f"Position in {symbol} is open with {new_position}.")
+            logger.info("Position in %s is open with %s.", symbol, new_position)
             
         return new_position
     
@@ -152,45 +250,63 @@ class EnhancedTradingBot:
     # API Request Methods
     #
     
-    def _generate_signature(self, data):
-        """Generate signature for API request."""
-        query_string = urllib.parse.urlencode(data)
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+    @staticmethod
+    def _build_query_string(data):
+        """Build the request query string from a params dict."""
+        # Futures params are plain ASCII symbols and numbers, so the query
+        # string is joined directly instead of going through urlencode
+        return '&'.join(f"{key}={value}" for key, value in data.items())
+    
+    def _generate_signature(self, query_string):
+        """Generate signature for an API request query string."""
+        return hmac.digest(self._api_secret_bytes, query_string.encode('utf-8'), 'sha256').hex()
+        
+    def _get_session(self):
+        """Return the HTTP session used for direct Futures requests.
+        
+        The session keeps connections (and their TLS handshakes) alive across
+        calls. Retry only applies to idempotent methods, so orders (POST) are
+        never resent.
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            session.headers['X-MBX-APIKEY'] = self.api_key
+            session.mount('https://', HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504],
+                                  raise_on_status=False)
+            ))
+            self._session = session
+        return self._session
         
     def _make_futures_request(self, method, endpoint, params=None):
         """Make a direct request to Binance Futures API."""
-        base_url = TESTNET_BASE_URL if self.testnet else 'https://fapi.binance.com'
-        url = f"{base_url}/fapi/{endpoint}"
+        url = f"{self._base_url}/fapi/{endpoint}"
         
-        # Add timestamp and signature
+        # Add timestamp and signature. The signed query string is sent as is,
+        # so requests doesn't encode the params a second time.
         params = params or {}
-        params['timestamp'] = int(time.time() * 1000)
-        params['signature'] = self._generate_signature(params)
-        
-        # Add API key to headers
-        headers = {'X-MBX-APIKEY': self.api_key}
+        params['timestamp'] = time.time_ns() // 1_000_000
+        query_string = self._build_query_string(params)
+        signature = self._generate_signature(query_string)
         
-        # Make request
-        if method == 'GET':
-            response = requests.get(url, params=params, headers=headers)
-        elif method == 'POST':
-            response = requests.post(url, params=params, headers=headers)
-        elif method == 'DELETE':
-            response = requests.delete(url, params=params, headers=headers)
-        else:
+        # Make request (API key header is set on the session)
+        if method not in ('GET', 'POST', 'DELETE'):
             raise ValueError(f"Unsupported method: {method}")
+        response = self._get_session().request(method, f"{url}?{query_string}&signature={signature}")
             
         # Check for errors
         if response.status_code != 200:
-            logger.error(f"API Error: {response.text}")
+            logger.error("API Error: %s", response.text)
             raise Exception(f"API Error: {response.text}")
             
-        return response.json()
+        # Parse the raw body ourselves so orjson is used when available
+        return _loads(response.content)
     
     #
     # Trading API Methods
@@ -204,26 +320,36 @@ class EnhancedTradingBot:
             # Use direct API request instead of client method
             account_info = self._make_futures_request('GET', 'v2/account')
             
-            logger.info(f"Account info: {account_info}")
+            logger.info("Account info: %s", account_info)
             return account_info
         except Exception as e:
-            logger.error(f"API Error while getting account info: {e}")
+            logger.error("API Error while getting account info: %s", e)
             raise
     
+    def _get_asset_index(self):
+        """Return account assets keyed by asset, refetched after ACCOUNT_CACHE_TTL seconds."""
+        # Work on locals: an order placed on another thread may reset the
+        # cache between the check and the return
+        index, fetched_at = self._asset_index, self._asset_index_time
+        now = time.monotonic()
+        if index is None or now - fetched_at >= ACCOUNT_CACHE_TTL:
+            account_info = self.client.futures_account()
+            index = {balance['asset']: balance for balance in account_info['assets']}
+            self._asset_index, self._asset_index_time = index, now
+        return index
+    
     def get_balance(self, asset='USDT'):
         """Get balance for a specific asset."""
         try:
             logger.log_request("get_balance", {"asset": asset})
-            account_info = self.client.futures_account()
-            
-            for balance in account_info['assets']:
-                if balance['asset'] == asset:
-                    logger.log_response(balance)
-                    return float(balance['availableBalance'])
+            balance = self._get_asset_index().get(asset)
+            if balance is not None:
+                logger.log_response(balance)
+                return float(balance['availableBalance'])
             
-            logger.warning(f"Asset {asset} not found in account")
+            logger.warning("Asset %s not found in account", asset)
             return 0.0
-        except (BinanceAPIException, BinanceRequestException) as e:
+        except _binance_errors() as e:
             logger.log_error(e)
             raise
     
@@ -234,11 +360,28 @@ class EnhancedTradingBot:
             ticker = self.client.futures_symbol_ticker(symbol=symbol)
             logger.log_response(ticker)
             return float(ticker['price'])
-        except (BinanceAPIException, BinanceRequestException) as e:
+        except _binance_errors() as e:
             logger.log_error(e)
             raise
     
-    def place_market_order(self, symbol=DEFAULT_SYMBOL, side='BUY', quantity=None):
+    def _create_order(self, endpoint, params, wait_fill):
+        """Submit an order and return its create response.
+        
+        Orders ask for newOrderRespType=RESULT, so the response already
+        reports the final status and fills; pass wait_fill=True to re-query
+        the order status before returning.
+        """
+        logger.log_request(endpoint, params)
+        order = self.client.futures_create_order(newOrderRespType="RESULT", **params)
+        logger.log_response(order)
+        # Balances changed; force the next get_balance to refetch
+        self._asset_index = None
+        
+        if wait_fill:
+            order = self.get_order_status(params['symbol'], order['orderId'])
+        return order
+    
+    def place_market_order(self, symbol=DEFAULT_SYMBOL, side='BUY', quantity=None, wait_fill=False):
         """Place a market order and update position."""
         try:
             if quantity is None:
@@ -252,27 +395,22 @@ class EnhancedTradingBot:
                 "quantity": quantity
             }
             
-            logger.log_request("place_market_order", params)
-            order = self.client.futures_create_order(**params)
-            logger.log_response(order)
-            
-            # Get order status
-            order_status = self.get_order_status(symbol, order['orderId'])
+            order = self._create_order("place_market_order", params, wait_fill)
             
             # Update position
             is_buy = (side.upper() == 'BUY')
             new_position = self.update_position(symbol, quantity, is_buy)
-            logger.info(f"{'Bought' if is_buy else 'Sold'} {quantity} {symbol}. Current net quantity: {new_position}")
+            logger.info("%s %s %s. Current net quantity: %s", 'Bought' if is_buy else 'Sold', quantity, symbol, new_position)
             
             # Add final quantity to order status for display
-            order_status['final_quantity'] = new_position
+            order['final_quantity'] = new_position
             
-            return order_status
-        except (BinanceAPIException, BinanceRequestException) as e:
+            return order
+        except _binance_errors() as e:
             logger.log_error(e)
             raise
     
-    def place_limit_order(self, symbol=DEFAULT_SYMBOL, side='BUY', quantity=None, price=None):
+    def place_limit_order(self, symbol=DEFAULT_SYMBOL, side='BUY', quantity=None, price=None, wait_fill=False):
         """Place a limit order and update position."""
         try:
             if quantity is None or price is None:
@@ -288,29 +426,24 @@ class EnhancedTradingBot:
                 "price": price
             }
             
-            logger.log_request("place_limit_order", params)
-            order = self.client.futures_create_order(**params)
-            logger.log_response(order)
-            
-            # Get order status
-            order_status = self.get_order_status(symbol, order['orderId'])
+            order = self._create_order("place_limit_order", params, wait_fill)
             
             # Update position (for limit orders, we update when the order is filled)
             # This is a simplification - in a real system, you'd listen for order updates
             is_buy = (side.upper() == 'BUY')
-            if order_status.get('status') == 'FILLED':
+            if order.get('status') == 'FILLED':
                 new_position = self.update_position(symbol, quantity, is_buy)
-                logger.info(f"{'Bought' if is_buy else 'Sold'} {quantity} {symbol}. Current net quantity: {new_position}")
+                logger.info("%s %s %s. Current net quantity: %s", 'Bought' if is_buy else 'Sold', quantity, symbol, new_position)
                 # Add final quantity to order status for display
-                order_status['final_quantity'] = new_position
+                order['final_quantity'] = new_position
             
-            return order_status
-        except (BinanceAPIException, BinanceRequestException) as e:
+            return order
+        except _binance_errors() as e:
             logger.log_error(e)
             raise
     
     def place_stop_limit_order(self, symbol=DEFAULT_SYMBOL, side='BUY', quantity=None, 
-                              price=None, stop_price=None):
+                              price=None, stop_price=None, wait_fill=False):
         """Place a stop limit order."""
         try:
             if quantity is None or price is None or stop_price is None:
@@ -327,23 +460,18 @@ class EnhancedTradingBot:
                 "stopPrice": stop_price
             }
             
-            logger.log_request("place_stop_limit_order", params)
-            order = self.client.futures_create_order(**params)
-            logger.log_response(order)
-            
-            # Get order status
-            order_status = self.get_order_status(symbol, order['orderId'])
+            order = self._create_order("place_stop_limit_order", params, wait_fill)
             
             # For stop orders, position is updated when the order is triggered and filled
-            if order_status.get('status') == 'FILLED':
+            if order.get('status') == 'FILLED':
                 is_buy = (side.upper() == 'BUY')
                 new_position = self.update_position(symbol, quantity, is_buy)
-                logger.info(f"{'Bought' if is_buy else 'Sold'} {quantity} {symbol}. Current net quantity: {new_position}")
+                logger.info("%s %s %s. Current net quantity: %s", 'Bought' if is_buy else 'Sold', quantity, symbol, new_position)
                 # Add final quantity to order status for display
-                order_status['final_quantity'] = new_position
+                order['final_quantity'] = new_position
             
-            return order_status
-        except (BinanceAPIException, BinanceRequestException) as e:
+            return order
+        except _binance_errors() as e:
             logger.log_error(e)
             raise
     
@@ -354,7 +482,7 @@ class EnhancedTradingBot:
             order = self.client.futures_get_order(symbol=symbol, orderId=order_id)
             logger.log_response(order)
             return order
-        except (BinanceAPIException, BinanceRequestException) as e:
+        except _binance_errors() as e:
             logger.log_error(e)
             raise
     
@@ -365,7 +493,7 @@ class EnhancedTradingBot:
             orders = self.client.futures_get_open_orders(symbol=symbol)
             logger.log_response(orders)
             return orders
-        except (BinanceAPIException, BinanceRequestException) as e:
+        except _binance_errors() as e:
             logger.log_error(e)
             raise
     
@@ -375,12 +503,129 @@ class EnhancedTradingBot:
             logger.log_request("cancel_order", {"symbol": symbol, "orderId": order_id})
             result = self.client.futures_cancel_order(symbol=symbol, orderId=order_id)
             logger.log_response(result)
+            self._asset_index = None
             return result
-        except (BinanceAPIException, BinanceRequestException) as e:
+        except _binance_errors() as e:
             logger.log_error(e)
             raise
 
 
+def _cli_account(bot, argv):
+    """Handle the account command."""
+    account_info = bot.get_account_info()
+    print(json.dumps(account_info, indent=2))
+
+
+def _cli_balance(bot, argv):
+    """Handle the balance command."""
+    asset = argv[2] if len(argv) > 2 else "USDT"
+    balance = bot.get_balance(asset)
+    print(f"Balance for {asset}: {balance}")
+
+
+def _cli_price(bot, argv):
+    """Handle the price command."""
+    symbol = argv[2] if len(argv) > 2 else DEFAULT_SYMBOL
+    price = bot.get_market_price(symbol)
+    print(f"Current price for {symbol}: {price}")
+
+
+def _cli_market(bot, argv):
+    """Handle the market command."""
+    symbol = argv[2]
+    side = argv[3].upper()
+    quantity = float(argv[4])
+    
+    order = bot.place_market_order(symbol=symbol, side=side, quantity=quantity)
+    print(f"Market order placed: {order}")
+    if 'final_quantity' in order:
+        print(f"Final {symbol} position after order: {order['final_quantity']}")
+
+
+def _cli_limit(bot, argv):
+    """Handle the limit command."""
+    symbol = argv[2]
+    side = argv[3].upper()
+    quantity = float(argv[4])
+    price = float(argv[5])
+    
+    order = bot.place_limit_order(symbol=symbol, side=side, quantity=quantity, price=price)
+    print(f"Limit order placed: {order}")
+    if 'final_quantity' in order:
+        print(f"Final {symbol} position after order: {order['final_quantity']}")
+
+
+def _cli_stop(bot, argv):
+    """Handle the stop command."""
+    symbol = argv[2]
+    side = argv[3].upper()
+    quantity = float(argv[4])
+    price = float(argv[5])
+    stop_price = float(argv[6])
+    
+    order = bot.place_stop_limit_order(
+        symbol=symbol, side=side, quantity=quantity, price=price, stop_price=stop_price
+    )
+    print(f"Stop-limit order placed: {order}")
+    if 'final_quantity' in order:
+        print(f"Final {symbol} position after order: {order['final_quantity']}")
+
+
+def _cli_open_orders(bot, argv):
+    """Handle the open_orders command."""
+    symbol = argv[2] if len(argv) > 2 else DEFAULT_SYMBOL
+    orders = bot.get_open_orders(symbol)
+    
+    if not orders:
+        print(f"No open orders for {symbol}")
+    else:
+        print(f"Open orders for {symbol}:")
+        for order in orders:
+            print(json.dumps(order, indent=2))
+
+
+def _cli_cancel(bot, argv):
+    """Handle the cancel command."""
+    symbol = argv[2]
+    order_id = int(argv[3])
+    
+    result = bot.cancel_order(symbol, order_id)
+    print(f"Order cancelled: {result}")
+
+
+def _cli_position(bot, argv):
+    """Handle the position command."""
+    symbol = argv[2].upper()
+    position = bot.get_position(symbol)
+    print(f"Current position for {symbol}: {position}")
+
+
+def _cli_positions(bot, argv):
+    """Handle the positions command."""
+    positions = bot.get_all_positions()
+    if positions:
+        print("Current positions:")
+        for symbol, quantity in positions.items():
+            print(f"  {symbol}: {quantity}")
+    else:
+        print("No open positions.")
+
+
+# Command name -> (handler, minimum len(sys.argv))
+_CLI_COMMANDS = {
+    "account": (_cli_account, 2),
+    "balance": (_cli_balance, 2),
+    "price": (_cli_price, 2),
+    "market": (_cli_market, 5),
+    "limit": (_cli_limit, 6),
+    "stop": (_cli_stop, 7),
+    "open_orders": (_cli_open_orders, 2),
+    "cancel": (_cli_cancel, 4),
+    "position": (_cli_position, 3),
+    "positions": (_cli_positions, 2),
+}
+
+
 def cli_interface():
     """Command-line interface for the trading bot."""
     if len(sys.argv) < 2:
@@ -397,101 +642,21 @@ def cli_interface():
         print("  python enhanced_trading_bot.py positions")
         return
     
-    # Create logs directory if it doesn't exist
-    os.makedirs("logs", exist_ok=True)
+    command = sys.argv[1].lower()
     
-    # Initialize bot
-    bot = EnhancedTradingBot()
+    handler, min_args = _CLI_COMMANDS.get(command, (None, 0))
+    if handler is None or len(sys.argv) < min_args:
+        print("Invalid command or arguments.")
+        print("Use 'python enhanced_trading_bot.py' without arguments to see usage instructions.")
+        return
     
-    command = sys.argv[1].lower()
+    # Initialize bot with a lazy client: the Binance connection is only made
+    # by commands that call the API, so position/positions stay offline
+    bot = EnhancedTradingBot(lazy_client=True)
     
     try:
-        if command == "account":
-            account_info = bot.get_account_info()
-            print(json.dumps(account_info, indent=2))
-            
-        elif command == "balance":
-            asset = sys.argv[2] if len(sys.argv) > 2 else "USDT"
-            balance = bot.get_balance(asset)
-            print(f"Balance for {asset}: {balance}")
-            
-        elif command == "price":
-            symbol = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_SYMBOL
-            price = bot.get_market_price(symbol)
-            print(f"Current price for {symbol}: {price}")
-            
-        elif command == "market" and len(sys.argv) >= 5:
-            symbol = sys.argv[2]
-            side = sys.argv[3].upper()
-            quantity = float(sys.argv[4])
-            
-            order = bot.place_market_order(symbol=symbol, side=side, quantity=quantity)
-            print(f"Market order placed: {order}")
-            if 'final_quantity' in order:
-                print(f"Final {symbol} position after order: {order['final_quantity']}")
-            
-        elif command == "limit" and len(sys.argv) >= 6:
-            symbol = sys.argv[2]
-            side = sys.argv[3].upper()
-            quantity = float(sys.argv[4])
-            price = float(sys.argv[5])
-            
-            order = bot.place_limit_order(symbol=symbol, side=side, quantity=quantity, price=price)
-            print(f"Limit order placed: {order}")
-            if 'final_quantity' in order:
-                print(f"Final {symbol} position after order: {order['final_quantity']}")
-            
-        elif command == "stop" and len(sys.argv) >= 7:
-            symbol = sys.argv[2]
-            side = sys.argv[3].upper()
-            quantity = float(sys.argv[4])
-            price = float(sys.argv[5])
-            stop_price = float(sys.argv[6])
-            
-            order = bot.place_stop_limit_order(
-                symbol=symbol, side=side, quantity=quantity, price=price, stop_price=stop_price
-            )
-            print(f"Stop-limit order placed: {order}")
-            if 'final_quantity' in order:
-                print(f"Final {symbol} position after order: {order['final_quantity']}")
-            
-        elif command == "open_orders":
-            symbol = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_SYMBOL
-            orders = bot.get_open_orders(symbol)
-            
-            if not orders:
-                print(f"No open orders for {symbol}")
-            else:
-                print(f"Open orders for {symbol}:")
-                for order in orders:
-                    print(json.dumps(order, indent=2))
-                    
-        elif command == "cancel" and len(sys.argv) >= 4:
-            symbol = sys.argv[2]
-            order_id = int(sys.argv[3])
-            
-            result = bot.cancel_order(symbol, order_id)
-            print(f"Order cancelled: {result}")
-            
-        elif command == "position" and len(sys.argv) >= 3:
-            symbol = sys.argv[2].upper()
-            position = bot.get_position(symbol)
-            print(f"Current position for {symbol}: {position}")
-            
-        elif command == "positions":
-            positions = bot.get_all_positions()
-            if positions:
-                print("Current positions:")
-                for symbol, quantity in positions.items():
-                    print(f"  {symbol}: {quantity}")
-            else:
-                print("No open positions.")
-                
-        else:
-            print("Invalid command or arguments.")
-            print("Use 'python enhanced_trading_bot.py' without arguments to see usage instructions.")
-            
-    except (BinanceAPIException, BinanceRequestException) as e:
+        handler(bot, sys.argv)
+    except _binance_errors() as e:
         print(f"API Error: {e}")
     except ValueError as e:
         print(f"Value Error: {e}")
@@ -1,66 +1,200 @@
+import atexit
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import queue
 from config import LOG_LEVEL, LOG_FILE
 
+# The formatter never uses thread/process fields, so skip collecting them
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Records buffered between callers and the listener thread before the oldest
+# are dropped; keeps memory bounded during error storms
+_LOG_QUEUE_SIZE = 10000
+
+# File stream buffer, sized for a full MemoryHandler batch of typical records
+_LOG_BUFFER_SIZE = 64 * 1024
+
+
+class _DropOldestQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that discards the oldest pending record when the queue is full."""
+    def enqueue(self, record):
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                try:
+                    dropped = self.queue.get_nowait()
+                except queue.Empty:
+                    continue
+                self.queue.task_done()
+                if dropped is _QueueListener._sentinel:
+                    # The listener is stopping and would never reach this
+                    # record; requeue its sentinel so stop() can finish
+                    self.queue.put(dropped)
+                    return
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    """QueueListener whose stop() waits for room rather than failing on a full queue."""
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+class _BatchFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that leaves flushing to the buffering handler in front of it."""
+    def __init__(self, *args, **kwargs):
+        # Bytes in the current file, and the size of the record being emitted
+        self._size = 0
+        self._pending = 0
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        # Buffer roughly a full batch so each flush_batch() is about one write
+        stream = self._builtin_open(self.baseFilename, self.mode, buffering=_LOG_BUFFER_SIZE,
+                                    encoding=self.encoding, errors=self.errors)
+        # Seed the size once per open (including after a rollover)
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def shouldRollover(self, record):
+        # Track the file size in memory: the stock check stats the path and
+        # seeks the stream, which flushes it, for every record
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0:
+            return False
+        self._pending = len(self.format(record)) + len(self.terminator)
+        return self._size + self._pending >= self.maxBytes
+
+    def emit(self, record):
+        super().emit(record)
+        self._size += self._pending
+
+    def flush(self):
+        # StreamHandler.emit() flushes after every record; skip that so a
+        # batch only reaches the file when flush_batch() runs
+        pass
+
+    def flush_batch(self):
+        """Flush the underlying stream once a batch has been emitted."""
+        super().flush()
+
+
+class _BatchMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that flushes its target's stream once per batch."""
+    def flush(self):
+        with self.lock:
+            super().flush()
+            if self.target:
+                self.target.flush_batch()
+
+
+# QueueListener per configured logger name
+_listeners = {}
+
+# Set once the logs directory has been created in this process
+_logs_dir_ready = False
+
+
+def _ensure_logs_dir():
+    """Create the logs directory the first time a file handler needs it."""
+    global _logs_dir_ready
+    if not _logs_dir_ready:
+        os.makedirs('logs', exist_ok=True)
+        _logs_dir_ready = True
+
 class Logger:
     def __init__(self, name='trading_bot'):
         """Initialize logger with the given name."""
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(getattr(logging, LOG_LEVEL))
+        self._level_no = getattr(logging, LOG_LEVEL)
         
-        # Create logs directory if it doesn't exist
-        os.makedirs('logs', exist_ok=True)
+        # Python loggers are per-name singletons; only configure handlers once
+        # so re-instantiating Logger never duplicates every emit
+        if self.logger.handlers:
+            self.listener = _listeners.get(name)
+            return
+        self.logger.setLevel(self._level_no)
         
-        # File handler with timestamp
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        file_handler = logging.FileHandler(f'logs/{timestamp}_{LOG_FILE}')
-        file_handler.setLevel(getattr(logging, LOG_LEVEL))
+        # Size-rotated log file, opened on the first record
+        _ensure_logs_dir()
+        file_handler = _BatchFileHandler(
+            f'logs/{LOG_FILE}', maxBytes=16 * 1024 * 1024, backupCount=5, delay=True
+        )
+        file_handler.setLevel(self._level_no)
         
         # Console handler
         console_handler = logging.StreamHandler()
-        console_handler.setLevel(getattr(logging, LOG_LEVEL))
+        console_handler.setLevel(self._level_no)
         
-        # Create formatter and add it to the handlers
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        # Create formatter and add it to the handlers. An explicit datefmt
+        # skips the per-record millisecond suffix formatting.
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                                      datefmt='%Y-%m-%d %H:%M:%S')
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        # Add handlers to logger
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # Batch file writes: records are held in memory and written in
+        # chunks with a single stream flush each, while ERROR and above are
+        # flushed straight away
+        buffered_handler = _BatchMemoryHandler(
+            capacity=512, flushLevel=logging.ERROR, target=file_handler
+        )
+        atexit.register(buffered_handler.close)
+        
+        # Callers only enqueue records; a background listener thread owns the
+        # real handlers (console stays unbuffered for live feedback)
+        log_queue = queue.Queue(maxsize=_LOG_QUEUE_SIZE)
+        self.listener = _QueueListener(
+            log_queue, buffered_handler, console_handler, respect_handler_level=True
+        )
+        self.listener.start()
+        _listeners[name] = self.listener
+        # Registered after the buffer's close so the queue drains first
+        atexit.register(self.listener.stop)
+        
+        self.logger.addHandler(_DropOldestQueueHandler(log_queue))
     
-    def info(self, message):
+    def info(self, message, *args, **kwargs):
         """Log info level message."""
-        self.logger.info(message)
+        if self._level_no <= logging.INFO:
+            self.logger.info(message, *args, **kwargs)
     
-    def error(self, message):
+    def error(self, message, *args, **kwargs):
         """Log error level message."""
-        self.logger.error(message)
+        self.logger.error(message, *args, **kwargs)
     
-    def warning(self, message):
+    def warning(self, message, *args, **kwargs):
         """Log warning level message."""
-        self.logger.warning(message)
+        if self._level_no <= logging.WARNING:
+            self.logger.warning(message, *args, **kwargs)
     
-    def debug(self, message):
+    def debug(self, message, *args, **kwargs):
         """Log debug level message."""
-        self.logger.debug(message)
+        if self._level_no <= logging.DEBUG:
+            self.logger.debug(message, *args, **kwargs)
     
-    def critical(self, message):
+    def critical(self, message, *args, **kwargs):
         """Log critical level message."""
-        self.logger.critical(message)
+        self.logger.critical(message, *args, **kwargs)
         
     def log_request(self, endpoint, params=None):
         """Log API request details."""
-        self.logger.info(f"API Request: {endpoint}, Params: {params}")
+        if self._level_no <= logging.INFO:
+            self.logger.info("API Request: %s, Params: %s", endpoint, params)
     
     def log_response(self, response):
         """Log API response details."""
-        self.logger.info(f"API Response: {response}")
+        if self._level_no <= logging.INFO:
+            self.logger.info("API Response: %s", response)
     
     def log_error(self, error):
         """Log API error details."""
-        self.logger.error(f"API Error: {error}")
+        self.logger.error("API Error: %s", error)
 
 # Create a global logger instance
 logger = Logger()
\ No newline at end of file
@@ -1,8 +1,16 @@
 from binance.client import Client
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 API_KEY = "YOUR_KEY"
 API_SECRET = "YOUR_SECRET"
-client = Client(API_KEY, API_SECRET)
+client = Client(API_KEY, API_SECRET, requests_params={"timeout": 5})
+
+# Keep connections warm so the calls below reuse one TLS session
+client.session.mount("https://", HTTPAdapter(
+    pool_connections=4, pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.2)
+))
 
 # Point to futures testnet
 client.FUTURES_URL = "https://testnet.binancefuture.com"
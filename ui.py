@@ -1,9 +1,53 @@
+import re
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-import threading
-from enhanced_trading_bot import EnhancedTradingBot
+from decimal import Decimal
+from tkinter import ttk, scrolledtext
+from concurrent.futures import ThreadPoolExecutor
 from config import API_KEY, API_SECRET, TESTNET, DEFAULT_SYMBOL
-from logger import logger
+from display_fields import ACCOUNT_FIELDS, ORDER_FIELDS
+
+# Plain decimal number, validated before building an exact Decimal
+_NUM_RE = re.compile(r'^-?\d+(?:\.\d+)?$')
+
+
+def _parse(value, name):
+    """Parse a numeric entry field into a Decimal, raising ValueError(name) if invalid."""
+    value = value.strip()
+    if not _NUM_RE.match(value):
+        raise ValueError(name)
+    return Decimal(value)
+
+
+def _read_only_key(event):
+    """Swallow keystrokes aimed at a read-only text widget, except Ctrl+C."""
+    if event.state & 0x4 and event.keysym.lower() == 'c':
+        return None
+    return "break"
+
+
+def _first_invalid(**fields):
+    """Return the display name of the first field whose cached value is None."""
+    for name, value in fields.items():
+        if value is None:
+            return name.replace('_', ' ')
+    return None
+
+
+# Status log colour tags and size bound
+_STATUS_TAGS = {"error": "error", "success": "success"}
+_STATUS_MAX_LINES = 2000
+_STATUS_TRIM_EVERY = 100
+
+# Orders tab inputs: (label, StringVar attribute, default, row, column, choices,
+# cached value attribute, numeric). Fields with choices get a Combobox, the
+# rest a plain Entry. Numeric fields cache a Decimal, or None if invalid.
+_ORDER_FIELD_SPEC = (
+    ("Symbol:", "symbol_var", DEFAULT_SYMBOL, 0, 0, None, "_symbol", False),
+    ("Side:", "side_var", "BUY", 0, 2, ["BUY", "SELL"], "_side", False),
+    ("Quantity:", "quantity_var", "0.001", 1, 0, None, "_quantity", True),
+    ("Price:", "price_var", "", 1, 2, None, "_price", True),
+    ("Stop Price:", "stop_price_var", "", 2, 0, None, "_stop_price", True),
+)
 
 class TradingBotUI:
     def __init__(self, root):
@@ -11,24 +55,50 @@ class TradingBotUI:
         self.root.title("PrimeTrades - Trading Bot")
         self.root.geometry("700x600")
         self.root.resizable(True, True)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Reusable worker threads for API calls; also caps concurrent requests
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='bot-ui')
         
         # Create UI elements first
         self.create_widgets()
         
-        # Initialize bot after UI elements are created
+        # Connect on the worker pool so the window shows up straight away
         self.bot = None
         self.init_bot()
         
     def init_bot(self):
-        """Initialize the trading bot."""
+        """Connect the trading bot in the background and report the result."""
+        self.update_status("Connecting to Binance Futures Testnet...", "info")
+        self.run_in_thread(self._connect_bot)
+    
+    def _connect_bot(self):
+        """Create the trading bot; runs on the worker pool."""
         try:
-            self.bot = EnhancedTradingBot(API_KEY, API_SECRET, TESTNET)
-            self.update_status("Connected to Binance Futures Testnet", "success")
+            # Imported here so the trading stack loads only once the window
+            # exists; a missing dependency is reported like a failed connect
+            from enhanced_trading_bot import EnhancedTradingBot
+            
+            # Connect up front so the status reflects a real connection. This
+            # one bot (and its Binance client session) is shared by every
+            # worker-pool task, so connections are reused across clicks.
+            bot = EnhancedTradingBot(API_KEY, API_SECRET, TESTNET, lazy_client=False)
+            self.root.after(0, self._on_bot_ready, bot)
         except Exception as e:
-            self.update_status(f"Failed to connect to Binance API: {e}", "error")
+            self.root.after(0, self.update_status, f"Failed to connect to Binance API: {e}", "error")
+    
+    def _on_bot_ready(self, bot):
+        """Install the connected bot; runs on the Tk thread."""
+        self.bot = bot
+        for button in self._bot_buttons:
+            button.configure(state=tk.NORMAL)
+        self.update_status("Connected to Binance Futures Testnet", "success")
     
     def create_widgets(self):
         """Create all UI widgets."""
+        # Buttons that call into the bot; enabled once it has connected
+        self._bot_buttons = []
+        
         # Main frame
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -62,7 +132,10 @@ class TradingBotUI:
         # Status text
         self.status_text = scrolledtext.ScrolledText(status_frame, height=8, wrap=tk.WORD)
         self.status_text.pack(fill=tk.BOTH, expand=True)
-        self.status_text.config(state=tk.DISABLED)
+        self.status_text.tag_configure("error", foreground="red")
+        self.status_text.tag_configure("success", foreground="green")
+        self._make_read_only(self.status_text)
+        self._status_count = 0
         
         # Update status with initial message
         self.update_status("Ready", "info")
@@ -75,13 +148,15 @@ class TradingBotUI:
         
         # Account info button
         account_info_btn = ttk.Button(buttons_frame, text="Get Account Info", 
-                                     command=self.get_account_info)
+                                     command=self.get_account_info, state=tk.DISABLED)
         account_info_btn.pack(side=tk.LEFT, padx=5)
+        self._bot_buttons.append(account_info_btn)
         
         # Balance button
         balance_btn = ttk.Button(buttons_frame, text="Get Balance", 
-                                command=self.get_balance)
+                                command=self.get_balance, state=tk.DISABLED)
         balance_btn.pack(side=tk.LEFT, padx=5)
+        self._bot_buttons.append(balance_btn)
         
         # Asset input for balance
         ttk.Label(buttons_frame, text="Asset:").pack(side=tk.LEFT, padx=(20, 5))
@@ -95,7 +170,7 @@ class TradingBotUI:
         
         self.account_text = scrolledtext.ScrolledText(account_frame, height=10, wrap=tk.WORD)
         self.account_text.pack(fill=tk.BOTH, expand=True)
-        self.account_text.config(state=tk.DISABLED)
+        self._make_read_only(self.account_text)
     
     def create_orders_tab(self, parent):
         """Create widgets for the orders tab."""
@@ -103,35 +178,20 @@ class TradingBotUI:
         input_frame = ttk.Frame(parent)
         input_frame.pack(fill=tk.X, pady=10)
         
-        # Symbol input
-        ttk.Label(input_frame, text="Symbol:").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
-        self.symbol_var = tk.StringVar(value=DEFAULT_SYMBOL)
-        symbol_entry = ttk.Entry(input_frame, textvariable=self.symbol_var, width=15)
-        symbol_entry.grid(row=0, column=1, padx=5, pady=5, sticky=tk.W)
-        
-        # Side selection
-        ttk.Label(input_frame, text="Side:").grid(row=0, column=2, padx=5, pady=5, sticky=tk.W)
-        self.side_var = tk.StringVar(value="BUY")
-        side_combo = ttk.Combobox(input_frame, textvariable=self.side_var, values=["BUY", "SELL"], width=10)
-        side_combo.grid(row=0, column=3, padx=5, pady=5, sticky=tk.W)
-        
-        # Quantity input
-        ttk.Label(input_frame, text="Quantity:").grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
-        self.quantity_var = tk.StringVar(value="0.001")
-        quantity_entry = ttk.Entry(input_frame, textvariable=self.quantity_var, width=15)
-        quantity_entry.grid(row=1, column=1, padx=5, pady=5, sticky=tk.W)
-        
-        # Price input
-        ttk.Label(input_frame, text="Price:").grid(row=1, column=2, padx=5, pady=5, sticky=tk.W)
-        self.price_var = tk.StringVar()
-        price_entry = ttk.Entry(input_frame, textvariable=self.price_var, width=15)
-        price_entry.grid(row=1, column=3, padx=5, pady=5, sticky=tk.W)
-        
-        # Stop price input
-        ttk.Label(input_frame, text="Stop Price:").grid(row=2, column=0, padx=5, pady=5, sticky=tk.W)
-        self.stop_price_var = tk.StringVar()
-        stop_price_entry = ttk.Entry(input_frame, textvariable=self.stop_price_var, width=15)
-        stop_price_entry.grid(row=2, column=1, padx=5, pady=5, sticky=tk.W)
+        # Input fields, laid out from the spec table
+        for label, attr, default, row, column, choices, cache_attr, numeric in _ORDER_FIELD_SPEC:
+            ttk.Label(input_frame, text=label).grid(row=row, column=column, padx=5, pady=5, sticky=tk.W)
+            var = tk.StringVar(value=default)
+            setattr(self, attr, var)
+            # Keep a parsed copy in sync as the user types, so click handlers
+            # read plain attributes instead of calling back into Tcl
+            self._cache_field(var, cache_attr, numeric)
+            var.trace_add('write', lambda *_, v=var, a=cache_attr, n=numeric: self._cache_field(v, a, n))
+            if choices is None:
+                field = ttk.Entry(input_frame, textvariable=var, width=15)
+            else:
+                field = ttk.Combobox(input_frame, textvariable=var, values=choices, width=10)
+            field.grid(row=row, column=column + 1, padx=5, pady=5, sticky=tk.W)
         
         # Buttons frame
         buttons_frame = ttk.Frame(parent)
@@ -139,28 +199,33 @@ class TradingBotUI:
         
         # Market order button
         market_btn = ttk.Button(buttons_frame, text="Place Market Order", 
-                               command=self.place_market_order)
+                               command=self.place_market_order, state=tk.DISABLED)
         market_btn.pack(side=tk.LEFT, padx=5)
+        self._bot_buttons.append(market_btn)
         
         # Limit order button
         limit_btn = ttk.Button(buttons_frame, text="Place Limit Order", 
-                              command=self.place_limit_order)
+                              command=self.place_limit_order, state=tk.DISABLED)
         limit_btn.pack(side=tk.LEFT, padx=5)
+        self._bot_buttons.append(limit_btn)
         
         # Stop-limit order button
         stop_limit_btn = ttk.Button(buttons_frame, text="Place Stop-Limit Order", 
-                                   command=self.place_stop_limit_order)
+                                   command=self.place_stop_limit_order, state=tk.DISABLED)
         stop_limit_btn.pack(side=tk.LEFT, padx=5)
+        self._bot_buttons.append(stop_limit_btn)
         
         # Open orders button
         open_orders_btn = ttk.Button(buttons_frame, text="Get Open Orders", 
-                                    command=self.get_open_orders)
+                                    command=self.get_open_orders, state=tk.DISABLED)
         open_orders_btn.pack(side=tk.LEFT, padx=5)
+        self._bot_buttons.append(open_orders_btn)
         
         # Open positions button
         open_positions_btn = ttk.Button(buttons_frame, text="Show Open Positions", 
-                                      command=self.show_open_positions)
+                                      command=self.show_open_positions, state=tk.DISABLED)
         open_positions_btn.pack(side=tk.LEFT, padx=5)
+        self._bot_buttons.append(open_positions_btn)
         
         # Orders display
         orders_frame = ttk.LabelFrame(parent, text="Orders Information", padding="10")
@@ -168,44 +233,59 @@ class TradingBotUI:
         
         self.orders_text = scrolledtext.ScrolledText(orders_frame, height=10, wrap=tk.WORD)
         self.orders_text.pack(fill=tk.BOTH, expand=True)
-        self.orders_text.config(state=tk.DISABLED)
+        self._make_read_only(self.orders_text)
+    
+    def _make_read_only(self, widget):
+        """Block user edits on a text widget while code can still insert freely."""
+        widget.bind("<Key>", _read_only_key)
+        for sequence in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>"):
+            widget.bind(sequence, lambda event: "break")
+    
+    def _cache_field(self, var, cache_attr, numeric):
+        """Store the current value of an input field on the instance."""
+        value = var.get()
+        if numeric:
+            try:
+                value = _parse(value, cache_attr)
+            except ValueError:
+                value = None
+        setattr(self, cache_attr, value)
     
     def update_status(self, message, status_type="info"):
         """Update the status text area with a message."""
-        self.status_text.config(state=tk.NORMAL)
-        
-        # Add timestamp and format based on status type
-        if status_type == "error":
-            self.status_text.insert(tk.END, f"ERROR: {message}\n", "error")
-            self.status_text.tag_configure("error", foreground="red")
-        elif status_type == "success":
-            self.status_text.insert(tk.END, f"SUCCESS: {message}\n", "success")
-            self.status_text.tag_configure("success", foreground="green")
-        else:
-            self.status_text.insert(tk.END, f"INFO: {message}\n")
+        # Prefix and colour tag are based on status type
+        self.status_text.insert(tk.END, f"{status_type.upper()}: {message}\n", _STATUS_TAGS.get(status_type, ""))
+        
+        # Periodically drop old lines so the widget stays bounded
+        self._status_count += 1
+        if self._status_count % _STATUS_TRIM_EVERY == 0:
+            self.status_text.delete("1.0", f"end-{_STATUS_MAX_LINES}l")
         
         self.status_text.see(tk.END)
-        self.status_text.config(state=tk.DISABLED)
     
     def update_account_text(self, text):
         """Update the account text area."""
-        self.account_text.config(state=tk.NORMAL)
         self.account_text.delete(1.0, tk.END)
         self.account_text.insert(tk.END, text)
-        self.account_text.config(state=tk.DISABLED)
     
     def update_orders_text(self, text):
         """Update the orders text area."""
-        self.orders_text.config(state=tk.NORMAL)
         self.orders_text.delete(1.0, tk.END)
         self.orders_text.insert(tk.END, text)   
-        self.orders_text.config(state=tk.DISABLED)
+    
+    def _apply_result(self, update_text, text, status_msg, status_type):
+        """Update a text area and the status log in a single UI callback."""
+        update_text(text)
+        self.update_status(status_msg, status_type)
     
     def run_in_thread(self, func, *args, **kwargs):
-        """Run a function in a separate thread to avoid UI freezing."""
-        thread = threading.Thread(target=func, args=args, kwargs=kwargs)
-        thread.daemon = True
-        thread.start()
+        """Run a function on the worker pool to avoid UI freezing."""
+        return self._pool.submit(func, *args, **kwargs)
+    
+    def on_close(self):
+        """Stop accepting background work and close the window."""
+        self._pool.shutdown(wait=False)
+        self.root.destroy()
     
     def get_account_info(self):
         """Get account information."""
@@ -216,20 +296,15 @@ class TradingBotUI:
                 account_info = self.bot.get_account_info()
                 
                 # Format account info for display
-                display_text = "=== Account Information ===\n"
-                display_text += f"Account Type: {account_info.get('accountType', 'N/A')}\n"
-                display_text += f"Total Initial Margin: {account_info.get('totalInitialMargin', 'N/A')} USDT\n"
-                display_text += f"Total Maintenance Margin: {account_info.get('totalMaintMargin', 'N/A')} USDT\n"
-                display_text += f"Total Wallet Balance: {account_info.get('totalWalletBalance', 'N/A')} USDT\n"
-                display_text += f"Total Unrealized Profit: {account_info.get('totalUnrealizedProfit', 'N/A')} USDT\n"
-                display_text += f"Total Margin Balance: {account_info.get('totalMarginBalance', 'N/A')} USDT\n"
-                display_text += f"Available Balance: {account_info.get('availableBalance', 'N/A')} USDT\n"
+                lines = ["=== Account Information ==="]
+                lines.extend(template.format(account_info.get(key, 'N/A')) for template, key in ACCOUNT_FIELDS)
+                display_text = "\n".join(lines) + "\n"
                 
                 # Update UI
-                self.root.after(0, lambda: self.update_account_text(display_text))
-                self.root.after(0, lambda: self.update_status("Account information fetched successfully", "success"))
+                self.root.after(0, self._apply_result, self.update_account_text, display_text,
+                                "Account information fetched successfully", "success")
             except Exception as e:
-                self.root.after(0, lambda: self.update_status(f"Error fetching account info: {e}", "error"))
+                self.root.after(0, self.update_status, f"Error fetching account info: {e}", "error")
         
         self.run_in_thread(fetch_account)
     
@@ -243,27 +318,27 @@ class TradingBotUI:
                 balance = self.bot.get_balance(asset)
                 
                 # Format balance info for display
-                display_text = "=== Balance Information ===\n"
-                display_text += f"Asset: {asset}\n"
-                display_text += f"Available Balance: {balance} {asset}\n"
+                display_text = (
+                    "=== Balance Information ===\n"
+                    f"Asset: {asset}\n"
+                    f"Available Balance: {balance} {asset}\n"
+                )
                 
                 # Update UI
-                self.root.after(0, lambda: self.update_account_text(display_text))
-                self.root.after(0, lambda: self.update_status(f"Balance for {asset} fetched successfully", "success"))
+                self.root.after(0, self._apply_result, self.update_account_text, display_text,
+                                f"Balance for {asset} fetched successfully", "success")
             except Exception as e:
-                self.root.after(0, lambda: self.update_status(f"Error fetching balance: {e}", "error"))
+                self.root.after(0, self.update_status, f"Error fetching balance: {e}", "error")
         
         self.run_in_thread(fetch_balance)
     
     def place_market_order(self):
         """Place a market order."""
-        symbol = self.symbol_var.get()
-        side = self.side_var.get()
+        symbol, side, quantity = self._symbol, self._side, self._quantity
         
-        try:
-            quantity = float(self.quantity_var.get())
-        except ValueError:
-            self.update_status("Invalid quantity value", "error")
+        invalid = _first_invalid(quantity=quantity)
+        if invalid:
+            self.update_status(f"Invalid {invalid} value", "error")
             return
         
         self.update_status(f"Placing {side} market order for {quantity} {symbol}...", "info")
@@ -276,23 +351,20 @@ class TradingBotUI:
                 display_text = self._format_order_details(order)
                 
                 # Update UI
-                self.root.after(0, lambda: self.update_orders_text(display_text))
-                self.root.after(0, lambda: self.update_status("Market order placed successfully", "success"))
+                self.root.after(0, self._apply_result, self.update_orders_text, display_text,
+                                "Market order placed successfully", "success")
             except Exception as e:
-                self.root.after(0, lambda: self.update_status(f"Error placing market order: {e}", "error"))
+                self.root.after(0, self.update_status, f"Error placing market order: {e}", "error")
         
         self.run_in_thread(place_order)
     
     def place_limit_order(self):
         """Place a limit order."""
-        symbol = self.symbol_var.get()
-        side = self.side_var.get()
+        symbol, side, quantity, price = self._symbol, self._side, self._quantity, self._price
         
-        try:
-            quantity = float(self.quantity_var.get())
-            price = float(self.price_var.get())
-        except ValueError:
-            self.update_status("Invalid quantity or price value", "error")
+        invalid = _first_invalid(quantity=quantity, price=price)
+        if invalid:
+            self.update_status(f"Invalid {invalid} value", "error")
             return
         
         self.update_status(f"Placing {side} limit order for {quantity} {symbol} at {price}...", "info")
@@ -305,24 +377,21 @@ class TradingBotUI:
                 display_text = self._format_order_details(order)
                 
                 # Update UI
-                self.root.after(0, lambda: self.update_orders_text(display_text))
-                self.root.after(0, lambda: self.update_status("Limit order placed successfully", "success"))
+                self.root.after(0, self._apply_result, self.update_orders_text, display_text,
+                                "Limit order placed successfully", "success")
             except Exception as e:
-                self.root.after(0, lambda: self.update_status(f"Error placing limit order: {e}", "error"))
+                self.root.after(0, self.update_status, f"Error placing limit order: {e}", "error")
         
         self.run_in_thread(place_order)
     
     def place_stop_limit_order(self):
         """Place a stop-limit order."""
-        symbol = self.symbol_var.get()
-        side = self.side_var.get()
+        symbol, side = self._symbol, self._side
+        quantity, price, stop_price = self._quantity, self._price, self._stop_price
         
-        try:
-            quantity = float(self.quantity_var.get())
-            price = float(self.price_var.get())
-            stop_price = float(self.stop_price_var.get())
-        except ValueError:
-            self.update_status("Invalid quantity, price, or stop price value", "error")
+        invalid = _first_invalid(quantity=quantity, price=price, stop_price=stop_price)
+        if invalid:
+            self.update_status(f"Invalid {invalid} value", "error")
             return
         
         self.update_status(f"Placing {side} stop-limit order for {quantity} {symbol} at {price} (stop: {stop_price})...", "info")
@@ -337,16 +406,16 @@ class TradingBotUI:
                 display_text = self._format_order_details(order)
                 
                 # Update UI
-                self.root.after(0, lambda: self.update_orders_text(display_text))
-                self.root.after(0, lambda: self.update_status("Stop-limit order placed successfully", "success"))
+                self.root.after(0, self._apply_result, self.update_orders_text, display_text,
+                                "Stop-limit order placed successfully", "success")
             except Exception as e:
-                self.root.after(0, lambda: self.update_status(f"Error placing stop-limit order: {e}", "error"))
+                self.root.after(0, self.update_status, f"Error placing stop-limit order: {e}", "error")
         
         self.run_in_thread(place_order)
     
     def get_open_orders(self):
         """Get open orders."""
-        symbol = self.symbol_var.get()
+        symbol = self._symbol
         self.update_status(f"Fetching open orders for {symbol}...", "info")
         
         def fetch_orders():
@@ -356,15 +425,17 @@ class TradingBotUI:
                 if not orders:
                     display_text = "No open orders found."
                 else:
-                    display_text = "=== Open Orders ===\n\n"
+                    parts = ["=== Open Orders ===\n\n"]
                     for order in orders:
-                        display_text += self._format_order_details(order) + "\n\n"
+                        parts.append(self._format_order_details(order))
+                        parts.append("\n\n")
+                    display_text = "".join(parts)
                 
                 # Update UI
-                self.root.after(0, lambda: self.update_orders_text(display_text))
-                self.root.after(0, lambda: self.update_status("Open orders fetched successfully", "success"))
+                self.root.after(0, self._apply_result, self.update_orders_text, display_text,
+                                "Open orders fetched successfully", "success")
             except Exception as e:
-                self.root.after(0, lambda: self.update_status(f"Error fetching open orders: {e}", "error"))
+                self.root.after(0, self.update_status, f"Error fetching open orders: {e}", "error")
         
         self.run_in_thread(fetch_orders)
     
@@ -380,37 +451,30 @@ class TradingBotUI:
                 if not positions:
                     display_text = "No open positions found."
                 else:
-                    display_text = "=== Open Positions ===\n\n"
+                    parts = ["=== Open Positions ===\n\n"]
                     for symbol, quantity in positions.items():
-                        display_text += f"Symbol: {symbol}\n"
-                        display_text += f"Net Quantity: {quantity}\n"
-                        display_text += f"Position Type: {'LONG' if quantity > 0 else 'SHORT'}\n\n"
+                        parts.append(
+                            f"Symbol: {symbol}\n"
+                            f"Net Quantity: {quantity}\n"
+                            f"Position Type: {'LONG' if quantity > 0 else 'SHORT'}\n\n"
+                        )
+                    display_text = "".join(parts)
                 
                 # Update UI
-                self.root.after(0, lambda: self.update_orders_text(display_text))
-                self.root.after(0, lambda: self.update_status("Open positions fetched successfully", "success"))
+                self.root.after(0, self._apply_result, self.update_orders_text, display_text,
+                                "Open positions fetched successfully", "success")
             except Exception as e:
-                self.root.after(0, lambda: self.update_status(f"Error fetching open positions: {e}", "error"))
+                self.root.after(0, self.update_status, f"Error fetching open positions: {e}", "error")
         
         self.run_in_thread(fetch_positions)
     
     def _format_order_details(self, order):
         """Format order details for display."""
-        display_text = "=== Order Details ===\n"
-        display_text += f"Order ID: {order.get('orderId', 'N/A')}\n"
-        display_text += f"Symbol: {order.get('symbol', 'N/A')}\n"
-        display_text += f"Side: {order.get('side', 'N/A')}\n"
-        display_text += f"Type: {order.get('type', 'N/A')}\n"
-        display_text += f"Price: {order.get('price', 'N/A')}\n"
-        display_text += f"Original Quantity: {order.get('origQty', 'N/A')}\n"
-        display_text += f"Executed Quantity: {order.get('executedQty', 'N/A')}\n"
-        display_text += f"Status: {order.get('status', 'N/A')}\n"
-        display_text += f"Time In Force: {order.get('timeInForce', 'N/A')}\n"
-        
+        lines = ["=== Order Details ==="]
+        lines.extend(template.format(order.get(key, 'N/A')) for template, key in ORDER_FIELDS)
         if 'stopPrice' in order:
-            display_text += f"Stop Price: {order.get('stopPrice', 'N/A')}\n"
-        
-        return display_text
+            lines.append(f"Stop Price: {order.get('stopPrice', 'N/A')}")
+        return "\n".join(lines) + "\n"
 
 def main():
     root = tk.Tk()